@@ -6,6 +6,7 @@
 #
 
 import importlib
+import sys
 from enum import Enum
 import logging
 from django.conf import settings
@@ -27,6 +28,9 @@ def _import_hook(hook_path):
 
     This function dynamically imports a hook function specified by a dotted string path.
     It ensures that the imported object is callable and raises an error if it is not.
+    Modules that are already loaded are taken from sys.modules, so repeated lookups skip
+    the import machinery, while the function itself is looked up on every call so that
+    patching it takes effect.
 
     Args:
         hook_path (str): The dotted string path to the hook function.
@@ -39,7 +43,12 @@ def _import_hook(hook_path):
         TypeError: If the imported object is not callable.
     """
     module_path, function_name = hook_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
+    # same approach as django.utils.module_loading.cached_import, which needs django 4.0
+    module = sys.modules.get(module_path)
+    if module is None or getattr(
+        getattr(module, "__spec__", None), "_initializing", False
+    ):
+        module = importlib.import_module(module_path)
     function = getattr(module, function_name)
     if not callable(function):
         raise TypeError(f"Consumer getter ({hook_path}) must be callable")
@@ -6,6 +6,7 @@
 #
 from abc import ABC, abstractmethod
 from collections import defaultdict
+import functools
 import inspect
 import logging
 import types
@@ -26,6 +27,10 @@ IF_TRUTHY = 2
 DEFAULT_UNEXPANDED_VALUE = object()
 EXPANDABLE_FIELD_KEY = "__expandable__"
 
+# expansion trees are read-only mappings, so a cached tree can't be changed by one of the
+# requests sharing it
+_EMPTY_EXPANSION = types.MappingProxyType({})
+
 
 class _ExpandableForeignKey:
     def __init__(self, display_key, model_class, inst_field_name):
@@ -164,7 +169,9 @@ def _get_filtered_field_value(  # noqa: C901
                     if _is_relation(field_meta):
                         val_pk = getattr(inst, field_meta.attname)
                         val_cls = field_meta.related_model
-                        val_expand_children = expand_children.get(field_name, {})
+                        val_expand_children = expand_children.get(
+                            field_name, _EMPTY_EXPANSION
+                        )
                         cache_key = _make_filter_cache_key(
                             val_expand_children, val_cls, val_pk
                         )
@@ -305,7 +312,7 @@ def _apply_filters_to_object(  # noqa: C901
                     field_type,
                     filter_def,
                     expand_this=field_name in expand_children,
-                    expand_children=expand_children.get(field_name, {}),
+                    expand_children=expand_children.get(field_name, _EMPTY_EXPANSION),
                     filter_cache=filter_cache,
                     model_cache=model_cache,
                 )
@@ -334,15 +341,28 @@ def _compile_expansion(expand_fields):
     return top
 
 
+def _freeze_expansion(tree):
+    return types.MappingProxyType(
+        {key: _freeze_expansion(children) for key, children in tree.items()}
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_expand_header(expand_header):
+    # clients tend to send the same expand header on every request, so the compiled tree is
+    # shared between requests, and frozen so that none of them can change it
+    return _freeze_expansion(_compile_expansion(expand_header.split(",")))
+
+
 def is_caching_enabled():
     return getattr(settings, "DDA_FILTER_MODEL_CACHING_ENABLED", False)
 
 
 def apply_filters_to_object(inst, filter_def, expand_header=""):
     if expand_header:
-        expand_dict = _compile_expansion(expand_header.split(","))
+        expand_dict = _parse_expand_header(expand_header)
     else:
-        expand_dict = {}
+        expand_dict = _EMPTY_EXPANSION
     return _apply_filters_to_object(
         inst,
         filter_def,
@@ -5,17 +5,19 @@ from myapp.models import User
 
 
 class ModelsTestCase(TestCase):
-    def test_create_user(self):
-        consumer = models.OauthConsumer.objects.create(name="smith")
+    @classmethod
+    def setUpTestData(cls):
+        cls.consumer = models.OauthConsumer.objects.create(name="smith")
 
-        user = User(consumer=consumer, name="smith")
+    def test_create_user(self):
+        user = User(consumer=self.consumer, name="smith")
         user.save()
 
-        self.assertEqual(user.consumer.content_type_id, consumer.content_type_id)
-        self.assertEqual(user.consumer.id, consumer.id)
-        self.assertEqual(user.consumer.key, consumer.key)
-        self.assertEqual(user.consumer.name, consumer.name)
-        self.assertEqual(user.consumer.object_id, consumer.object_id)
-        self.assertEqual(user.consumer.secret, consumer.secret)
-        self.assertEqual(user.consumer.type, consumer.type)
+        self.assertEqual(user.consumer.content_type_id, self.consumer.content_type_id)
+        self.assertEqual(user.consumer.id, self.consumer.id)
+        self.assertEqual(user.consumer.key, self.consumer.key)
+        self.assertEqual(user.consumer.name, self.consumer.name)
+        self.assertEqual(user.consumer.object_id, self.consumer.object_id)
+        self.assertEqual(user.consumer.secret, self.consumer.secret)
+        self.assertEqual(user.consumer.type, self.consumer.type)
         self.assertEqual(user.name, "smith")
@@ -17,11 +17,16 @@ from django_declarative_apis import authentication
 from django_declarative_apis.authentication.oauthlib import oauth1, oauth_errors
 from tests import testutils
 
+_REQUEST_FACTORY = django.test.RequestFactory()
+
 
 class TwoLeggedOauth1TestCase(django.test.TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.consumer = models.OauthConsumer.objects.create(name="test")
+
     def setUp(self):
-        self.request_factory = django.test.RequestFactory()
-        self.consumer = models.OauthConsumer.objects.create(name="test")
+        self.request_factory = _REQUEST_FACTORY
 
     def test_validate_missing_parameters(self):
         request = self.request_factory.get("/")
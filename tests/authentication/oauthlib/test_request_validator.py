@@ -11,16 +11,18 @@ from unittest import mock
 from django_declarative_apis import models
 from django_declarative_apis.authentication.oauthlib import request_validator
 
+_REQUEST_FACTORY = django.test.RequestFactory()
+
 
 class DjangoRequestValidatorTestCase(django.test.TestCase):
-    def setUp(self):
-        self.consumer = models.OauthConsumer.objects.create(name="test")
-        self.consumer.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.consumer = models.OauthConsumer.objects.create(name="test")
 
     def test_get_client_secret_with_rsa_public_key_pem(self):
         self.consumer.rsa_public_key_pem = "something non-null"
 
-        request = django.test.RequestFactory().get("/")
+        request = _REQUEST_FACTORY.get("/")
 
         validator = request_validator.DjangoRequestValidator(request)
         validator.consumer = self.consumer
@@ -30,7 +32,7 @@ class DjangoRequestValidatorTestCase(django.test.TestCase):
         "django_declarative_apis.authentication.oauthlib.request_validator.logger"
     )
     def test_get_rsa_key(self, mock_log):
-        request = django.test.RequestFactory().get("/")
+        request = _REQUEST_FACTORY.get("/")
 
         validator = request_validator.DjangoRequestValidator(request)
 
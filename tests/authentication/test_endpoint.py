@@ -12,12 +12,10 @@ from django_declarative_apis import models
 from django_declarative_apis.authentication.oauthlib import endpoint, request_validator
 from tests import testutils
 
-
-# TODO: create tests for android and ios rsa signing
+_REQUEST_FACTORY = django.test.RequestFactory()
 
 
-def _oauth_qs(request):
-    return "&".join(["=".join((k, v)) for k, v in request.GET.items()])
+# TODO: create tests for android and ios rsa signing
 
 
 class TweakedSignatureOnlyEndpointTestCase(django.test.TestCase):
@@ -33,10 +31,12 @@ class TweakedSignatureOnlyEndpointTestCase(django.test.TestCase):
 
         return request, validator, endpoint_instance
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.consumer = models.OauthConsumer.objects.create(name="test")
+
     def setUp(self):
-        self.request = django.test.RequestFactory()
-        self.consumer = models.OauthConsumer.objects.create(name="test")
-        self.consumer.save()
+        self.request = _REQUEST_FACTORY
 
     def test_validate_request_missing_parameters_error(self):
         request, validator, endpoint_instance = self._request("/test")
@@ -48,7 +48,7 @@ class TweakedSignatureOnlyEndpointTestCase(django.test.TestCase):
         with self.settings(REQUIRE_HTTPS_FOR_OAUTH=True):
             request, validator, endpoint_instance = self._request("/test")
             result, _ = endpoint_instance.validate_request(
-                f"http://test?{_oauth_qs(request)}"
+                f"http://test?{request.GET.urlencode()}"
             )
 
         self.assertEqual(
@@ -65,7 +65,7 @@ class TweakedSignatureOnlyEndpointTestCase(django.test.TestCase):
         request.GET = params
 
         result, _ = endpoint_instance.validate_request(
-            f"http://test?{_oauth_qs(request)}"
+            f"http://test?{request.GET.urlencode()}"
         )
 
         self.assertEqual(
@@ -82,7 +82,7 @@ class TweakedSignatureOnlyEndpointTestCase(django.test.TestCase):
             f"{request.META['consumer'].key}:::{request.GET['oauth_nonce']}", True
         )
         result, _ = endpoint_instance.validate_request(
-            f"http://test?{_oauth_qs(request)}"
+            f"http://test?{request.GET.urlencode()}"
         )
 
         self.assertEqual(validator.validation_error_message, "nonce_used")
@@ -96,7 +96,7 @@ class TweakedSignatureOnlyEndpointTestCase(django.test.TestCase):
         request.GET = params
 
         result, _ = endpoint_instance.validate_request(
-            f"http://test?{_oauth_qs(request)}"
+            f"http://test?{request.GET.urlencode()}"
         )
         self.assertFalse(result)
 
@@ -108,7 +108,7 @@ class TweakedSignatureOnlyEndpointTestCase(django.test.TestCase):
         request.GET = params
 
         result, _ = endpoint_instance.validate_request(
-            f"http://test?{_oauth_qs(request)}"
+            f"http://test?{request.GET.urlencode()}"
         )
         self.assertTrue(
             endpoint_instance.validation_error_message.startswith(
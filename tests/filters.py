@@ -5,6 +5,9 @@
 # For full license text, see the LICENSE file in the repo root or https://opensource.org/licenses/BSD-3-Clause
 #
 
+import functools
+import types
+
 from django_declarative_apis.machinery.filtering import (
     ALWAYS,
     NEVER,
@@ -15,6 +18,16 @@ from django_declarative_apis.machinery.filtering import (
 from . import models
 
 
+@functools.lru_cache(maxsize=None)
+def _expandable(model_class=None, display_key=None, inst_field_name=None):
+    # identical expandable configurations share a single descriptor instance
+    return expandable(
+        model_class=model_class,
+        display_key=display_key,
+        inst_field_name=inst_field_name,
+    )
+
+
 class TestExpandableGeneric(ExpandableGeneric):
     def get_unexpanded_view(self, inst) -> dict:
         return {"id": "1234"}
@@ -23,94 +36,99 @@ class TestExpandableGeneric(ExpandableGeneric):
         return {"id": "1234", "expanded": True}
 
 
-DEFAULT_FILTERS = {
-    str: ALWAYS,
-    int: ALWAYS,
-    dict: ALWAYS,
-    models.TestModel: {
-        "pk": ALWAYS,
-        "int_field": ALWAYS,
-        "expandable_dict": expandable(),
-        "expandable_string": expandable(),
-        "expandable_generic": TestExpandableGeneric(),
-    },
-    models.ChildModel: {
-        "pk": ALWAYS,
-        "test": expandable(model_class=models.TestModel),
-        "name": ALWAYS,
-        "parent": expandable(model_class=models.ParentModel),
-    },
-    models.ParentModel: {
-        "nonstandard_id": ALWAYS,
-        "name": ALWAYS,
-        "favorite": expandable(model_class=models.ChildModel, display_key="name"),
-        "children": expandable(model_class=models.ChildModel, display_key="name"),
-    },
-    models.RootNode: {
-        "pk": ALWAYS,
-        "parent_field": expandable(model_class=models.ParentModel),
-        "parents": expandable(model_class=models.ParentModel),
-    },
-}
+_PRIMITIVE_FILTERS = {str: ALWAYS, int: ALWAYS, dict: ALWAYS}
 
-INEFFICIENT_FILTERS = {
-    models.InefficientLeaf: {"id": ALWAYS},
-    models.InefficientBranchA: {"leaf": ALWAYS},
-    models.InefficientBranchB: {"leaf": ALWAYS},
-    models.InefficientRoot: {"branch_a": ALWAYS, "branch_b": ALWAYS},
+_PARENT_MODEL_FILTERS = {
+    "nonstandard_id": ALWAYS,
+    "name": ALWAYS,
+    "favorite": _expandable(model_class=models.ChildModel, display_key="name"),
+    "children": _expandable(model_class=models.ChildModel, display_key="name"),
 }
 
-INEFFICIENT_FUNCTION_FILTERS = {
-    models.InefficientLeaf: {"id": ALWAYS},
-    models.InefficientBranchA: {"leaf": lambda inst: inst.leaf},
-    models.InefficientBranchB: {"leaf": lambda inst: inst.leaf},
-    models.PydanticBranch: {"id": ALWAYS},
-    models.InefficientRoot: {"branch_a": ALWAYS, "branch_b": ALWAYS},
-    models.InefficientPydanticRoot: {
-        "default_factory": NEVER,
-        "__len__": NEVER,
-        "branch_a": lambda inst: inst.branch_a,
-        "branch_b": lambda inst: inst.branch_b,
-        "branch_p": lambda inst: inst.branch_p,
-    },
-}
+DEFAULT_FILTERS = types.MappingProxyType(
+    {
+        **_PRIMITIVE_FILTERS,
+        models.TestModel: {
+            "pk": ALWAYS,
+            "int_field": ALWAYS,
+            "expandable_dict": _expandable(),
+            "expandable_string": _expandable(),
+            "expandable_generic": TestExpandableGeneric(),
+        },
+        models.ChildModel: {
+            "pk": ALWAYS,
+            "test": _expandable(model_class=models.TestModel),
+            "name": ALWAYS,
+            "parent": _expandable(model_class=models.ParentModel),
+        },
+        models.ParentModel: _PARENT_MODEL_FILTERS,
+        models.RootNode: {
+            "pk": ALWAYS,
+            "parent_field": _expandable(model_class=models.ParentModel),
+            "parents": _expandable(model_class=models.ParentModel),
+        },
+    }
+)
 
-RENAMED_EXPANDABLE_MODEL_FIELDS = {
-    str: ALWAYS,
-    int: ALWAYS,
-    dict: ALWAYS,
-    models.TestModel: {
-        "pk": ALWAYS,
-        "int_field": ALWAYS,
-        "renamed_expandable_dict": expandable(inst_field_name="expandable_dict"),
-        "renamed_expandable_string": expandable(inst_field_name="expandable_string"),
-    },
-    models.ParentModel: {
-        "nonstandard_id": ALWAYS,
-        "name": ALWAYS,
-        "favorite": expandable(model_class=models.ChildModel, display_key="name"),
-        "children": expandable(model_class=models.ChildModel, display_key="name"),
-    },
-    models.ChildModel: {
-        "pk": ALWAYS,
-        "renamed_test": expandable(
-            model_class=models.TestModel, inst_field_name="test"
-        ),
-        "name": ALWAYS,
-        "renamed_parent": expandable(
-            model_class=models.ParentModel, inst_field_name="parent"
-        ),
-    },
-}
+INEFFICIENT_FILTERS = types.MappingProxyType(
+    {
+        models.InefficientLeaf: {"id": ALWAYS},
+        models.InefficientBranchA: {"leaf": ALWAYS},
+        models.InefficientBranchB: {"leaf": ALWAYS},
+        models.InefficientRoot: {"branch_a": ALWAYS, "branch_b": ALWAYS},
+    }
+)
 
-DEFAULT_FILTERS_NO_EXPANDABLE = {
-    str: ALWAYS,
-    int: ALWAYS,
-    dict: ALWAYS,
-    models.TestModel: {
-        "pk": ALWAYS,
-        "int_field": ALWAYS,
-        "expandable_dict": ALWAYS,
-        "expandable_string": ALWAYS,
-    },
-}
+INEFFICIENT_FUNCTION_FILTERS = types.MappingProxyType(
+    {
+        models.InefficientLeaf: {"id": ALWAYS},
+        models.InefficientBranchA: {"leaf": lambda inst: inst.leaf},
+        models.InefficientBranchB: {"leaf": lambda inst: inst.leaf},
+        models.PydanticBranch: {"id": ALWAYS},
+        models.InefficientRoot: {"branch_a": ALWAYS, "branch_b": ALWAYS},
+        models.InefficientPydanticRoot: {
+            "default_factory": NEVER,
+            "__len__": NEVER,
+            "branch_a": lambda inst: inst.branch_a,
+            "branch_b": lambda inst: inst.branch_b,
+            "branch_p": lambda inst: inst.branch_p,
+        },
+    }
+)
+
+RENAMED_EXPANDABLE_MODEL_FIELDS = types.MappingProxyType(
+    {
+        **_PRIMITIVE_FILTERS,
+        models.TestModel: {
+            "pk": ALWAYS,
+            "int_field": ALWAYS,
+            "renamed_expandable_dict": _expandable(inst_field_name="expandable_dict"),
+            "renamed_expandable_string": _expandable(
+                inst_field_name="expandable_string"
+            ),
+        },
+        models.ParentModel: _PARENT_MODEL_FILTERS,
+        models.ChildModel: {
+            "pk": ALWAYS,
+            "renamed_test": _expandable(
+                model_class=models.TestModel, inst_field_name="test"
+            ),
+            "name": ALWAYS,
+            "renamed_parent": _expandable(
+                model_class=models.ParentModel, inst_field_name="parent"
+            ),
+        },
+    }
+)
+
+DEFAULT_FILTERS_NO_EXPANDABLE = types.MappingProxyType(
+    {
+        **_PRIMITIVE_FILTERS,
+        models.TestModel: {
+            "pk": ALWAYS,
+            "int_field": ALWAYS,
+            "expandable_dict": ALWAYS,
+            "expandable_string": ALWAYS,
+        },
+    }
+)
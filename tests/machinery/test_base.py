@@ -4,8 +4,11 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # For full license text, see the LICENSE file in the repo root or https://opensource.org/licenses/BSD-3-Clause
 #
+import contextlib
 import http
+import itertools
 import json
+import types
 import unittest
 
 import django.core.exceptions
@@ -27,10 +30,28 @@ from django_declarative_apis.resources.utils import HttpStatusCode
 from tests import testutils, models, filters
 
 _TEST_RESOURCE = {"foo": "bar"}
+_REQUEST_FACTORY = django.test.RequestFactory()
+
+
+class _EmptyResourceEndpoint(machinery.EndpointDefinition):
+    @property
+    def resource(self):
+        return {}
+
+
+class _AuthorizedEmptyResourceEndpoint(_EmptyResourceEndpoint):
+    def is_authorized(self):
+        return True
+
+
+class _DictResourceEndpoint(machinery.EndpointDefinition):
+    @machinery.endpoint_resource(type=dict)
+    def resource(self):
+        return _TEST_RESOURCE
 
 
 class EndpointResourceAttributeTestCase(
-    testutils.RequestCreatorMixin, unittest.TestCase
+    testutils.RequestCreatorMixin, django.test.TestCase
 ):
     def test_call(self):
         attrib = machinery.EndpointResourceAttribute(str)
@@ -41,15 +62,8 @@ class EndpointResourceAttributeTestCase(
         self.assertEqual(attrib.get_instance_value(None, None), attrib)
 
     def test_get_instance_value_dict(self):
-        expected_resource = {"foo": "bar"}
-
-        class _TestEndpoint(machinery.EndpointDefinition):
-            @machinery.endpoint_resource(type=dict)
-            def resource(self):
-                return expected_resource
-
-        endpoint = _TestEndpoint()
-        self.assertEqual(endpoint.resource, expected_resource)
+        endpoint = _DictResourceEndpoint()
+        self.assertEqual(endpoint.resource, _TEST_RESOURCE)
 
     def test_get_instance_value_custom_type(self):
         class _TestResource:
@@ -88,7 +102,7 @@ class EndpointResourceAttributeTestCase(
 
 
 class EndpointResponseAttributeTestCase(
-    testutils.RequestCreatorMixin, unittest.TestCase
+    testutils.RequestCreatorMixin, django.test.TestCase
 ):
     def test_call(self):
         attr = machinery.EndpointResponseAttribute(str)
@@ -132,15 +146,8 @@ class EndpointBinderTestCase(django.test.TestCase):
         class _TestException(Exception):
             pass
 
-        class _TestEndpoint(machinery.EndpointDefinition):
-            @property
-            def resource(self):
-                return {}
-
-        endpoint = _TestEndpoint()
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
+        endpoint = _EmptyResourceEndpoint()
+        manager = _make_manager(endpoint)
         manager.binding_exc_info = (
             _TestException,
             _TestException("something bad happened"),
@@ -186,9 +193,7 @@ class EndpointBinderTestCase(django.test.TestCase):
         ):
             with self.subTest(test_name):
                 endpoint = endpoint_cls()
-                manager = machinery.EndpointBinder.BoundEndpointManager(
-                    machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-                )
+                manager = _make_manager(endpoint)
 
                 class _FakeRequest:
                     META = {}
@@ -228,9 +233,7 @@ class EndpointBinderTestCase(django.test.TestCase):
                     wraps=models.DirtyFieldsModel.objects.update_or_create,
                 ) as mock_uoc:
                     endpoint = _TestEndpoint()
-                    manager = machinery.EndpointBinder.BoundEndpointManager(
-                        machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-                    )
+                    manager = _make_manager(endpoint)
                     try:
                         manager.get_response()
                         self.fail("This should have failed")
@@ -255,9 +258,7 @@ class EndpointBinderTestCase(django.test.TestCase):
                 return expected_response
 
         endpoint = _TestEndpoint()
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
+        manager = _make_manager(endpoint)
 
         status, resp = manager.get_response()
         self.assertEqual(status, http.HTTPStatus.OK)
@@ -286,9 +287,7 @@ class EndpointBinderTestCase(django.test.TestCase):
                 return http.HTTPStatus.BAD_REQUEST
 
         endpoint = _TestEndpoint()
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
+        manager = _make_manager(endpoint)
 
         try:
             manager.get_response()
@@ -317,6 +316,9 @@ class EndpointBinderTestCase(django.test.TestCase):
         }
 
         class _TestEndpoint(machinery.EndpointDefinition):
+            def is_authorized(self):
+                return True
+
             @machinery.endpoint_resource(type=_TestResource, filter=filter_def)
             def resource(self):
                 return data
@@ -325,16 +327,11 @@ class EndpointBinderTestCase(django.test.TestCase):
             def response(self):
                 return {"people": self.resource}
 
-            def __call__(self):
-                return self
-
-        endpoint = _TestEndpoint()
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
-        machinery.EndpointBinder(endpoint).create_bound_endpoint(manager, HttpRequest())
+        req = HttpRequest()
+        req.consumer = None
+        bound_endpoint = _bind_endpoint(_TestEndpoint, req)
 
-        status, resp = manager.get_response()
+        status, resp = bound_endpoint.get_response()
         self.assertEqual(status, http.HTTPStatus.OK)
         # make sure the list is in the expected order
         resp["people"].sort(key=lambda p: p["name"].lower())
@@ -342,6 +339,8 @@ class EndpointBinderTestCase(django.test.TestCase):
 
 
 class EndpointFilteringTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
+    sign_requests = False
+
     from django_declarative_apis.machinery.filtering import ALWAYS, NEVER
 
     class DummyClassOne:
@@ -373,25 +372,27 @@ class EndpointFilteringTestCase(testutils.RequestCreatorMixin, django.test.TestC
     class DummyClassFour(DummyClassThree):
         pass
 
-    TEST_FILTERS = {
-        str: ALWAYS,
-        DummyClassOne: {"foo": ALWAYS, "bar": ALWAYS},
-        DummyClassTwo: {
-            "baz": lambda inst: inst.baz.upper(),
-            "blah": lambda inst: inst.blah.upper(),
-        },
-        DummyClassThree: {
-            "foo": NEVER,
-            "a_number": lambda inst: inst.a_number + 5,
-            "when": ALWAYS,
-            "_in": ALWAYS,
-            "the": ALWAYS,
-            "course": NEVER,
-            "of": ALWAYS,
-            "human": ALWAYS,
-            "events": ALWAYS,
-        },
-    }
+    TEST_FILTERS = types.MappingProxyType(
+        {
+            str: ALWAYS,
+            DummyClassOne: {"foo": ALWAYS, "bar": ALWAYS},
+            DummyClassTwo: {
+                "baz": lambda inst: inst.baz.upper(),
+                "blah": lambda inst: inst.blah.upper(),
+            },
+            DummyClassThree: {
+                "foo": NEVER,
+                "a_number": lambda inst: inst.a_number + 5,
+                "when": ALWAYS,
+                "_in": ALWAYS,
+                "the": ALWAYS,
+                "course": NEVER,
+                "of": ALWAYS,
+                "human": ALWAYS,
+                "events": ALWAYS,
+            },
+        }
+    )
 
     def test_filter_inheritance_with_mixin(self):
         data = EndpointFilteringTestCase.DummyClassTwo()
@@ -423,7 +424,7 @@ class EndpointFilteringTestCase(testutils.RequestCreatorMixin, django.test.TestC
         self.assertEqual(endpoint_binder.consumer_attributes, [])
 
     def test_create_bound_endpoint_with_url_and_adhoc_query_fields(self):
-        req = django.test.RequestFactory().get("/")
+        req = _REQUEST_FACTORY.get("/")
         req.consumer = self.consumer
         testutils.OAuthClientHandler._build_request(req)
         params = req.GET.copy()
@@ -451,16 +452,11 @@ class EndpointFilteringTestCase(testutils.RequestCreatorMixin, django.test.TestC
     @mock.patch("django_declarative_apis.machinery.EndpointBinder._validate_endpoint")
     def test_create_bound_endpoint_exception_raised(self, mock_validate_endpoint):
         mock_validate_endpoint.side_effect = Exception("something bad happened")
-        req = django.test.RequestFactory().get("/")
+        req = _REQUEST_FACTORY.get("/")
         req.consumer = self.consumer
         testutils.OAuthClientHandler._build_request(req)
 
-        class _TestEndpoint(machinery.EndpointDefinition):
-            @property
-            def resource(self):
-                return {}
-
-        bound_endpoint = _bind_endpoint(_TestEndpoint, req)
+        bound_endpoint = _bind_endpoint(_EmptyResourceEndpoint, req)
 
         try:
             status, data = bound_endpoint.get_response()
@@ -470,7 +466,7 @@ class EndpointFilteringTestCase(testutils.RequestCreatorMixin, django.test.TestC
             self.assertEqual(err_inst, err)
 
     def test_validate_endpoint_unauthorized(self):
-        req = django.test.RequestFactory().get("/")
+        req = _REQUEST_FACTORY.get("/")
         req.consumer = self.consumer
         testutils.OAuthClientHandler._build_request(req)
 
@@ -622,7 +618,7 @@ class EndpointFilteringTestCase(testutils.RequestCreatorMixin, django.test.TestC
 
 
 class EndpointRequestLifecycleManagerTestCase(
-    testutils.RequestCreatorMixin, unittest.TestCase
+    testutils.RequestCreatorMixin, django.test.TestCase
 ):
     def test_process_request_and_get_response_success(self):
         req = self.create_request()
@@ -642,44 +638,31 @@ class EndpointRequestLifecycleManagerTestCase(
         self.assertEqual(data, expected_data)
 
 
-class EndpointDefinitionTestCase(testutils.RequestCreatorMixin, unittest.TestCase):
+class EndpointDefinitionTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
+    sign_requests = False
+
     def test_is_permitted(self):
         self.consumer.type = dda_models.BaseConsumer.TYPE_READ_ONLY
         self.consumer.save()
 
-        class _TestEndpoint(machinery.EndpointDefinition):
-            def is_authorized(self):
-                return True
-
-            @property
-            def resource(self):
-                return {}
-
         # client should be able to access read endpoints
         req = self.create_request()
-        bound_endpoint = _bind_endpoint(_TestEndpoint, req)
+        bound_endpoint = _bind_endpoint(_AuthorizedEmptyResourceEndpoint, req)
         status, _ = bound_endpoint.get_response()
         self.assertEqual(status, http.HTTPStatus.OK)
 
         # but not write
         req = self.create_request(method="POST")
-        bound_endpoint = _bind_endpoint(_TestEndpoint, req)
+        bound_endpoint = _bind_endpoint(_AuthorizedEmptyResourceEndpoint, req)
         self.assertRaises(errors.ClientErrorForbidden, bound_endpoint.get_response)
 
     def test_is_permitted_readonly(self):
         self.consumer.type = dda_models.BaseConsumer.TYPE_READ_ONLY
         self.consumer.save()
 
-        class _TestReadOnlyEndpoint(machinery.EndpointDefinition):
+        class _TestReadOnlyEndpoint(_AuthorizedEmptyResourceEndpoint):
             is_read_only = True
 
-            def is_authorized(self):
-                return True
-
-            @property
-            def resource(self):
-                return {}
-
         req = self.create_request(method="POST")
         bound_endpoint = _bind_endpoint(_TestReadOnlyEndpoint, req)
         status, _ = bound_endpoint.get_response()
@@ -689,20 +672,12 @@ class EndpointDefinitionTestCase(testutils.RequestCreatorMixin, unittest.TestCas
         self.consumer.type = "invalid"
         self.consumer.save()
 
-        class _TestEndpoint(machinery.EndpointDefinition):
-            def is_authorized(self):
-                return True
-
-            @property
-            def resource(self):
-                return {}
-
         req = self.create_request()
-        bound_endpoint = _bind_endpoint(_TestEndpoint, req)
+        bound_endpoint = _bind_endpoint(_AuthorizedEmptyResourceEndpoint, req)
         self.assertRaises(errors.ClientErrorForbidden, bound_endpoint.get_response)
 
         req = self.create_request(method="POST")
-        bound_endpoint = _bind_endpoint(_TestEndpoint, req)
+        bound_endpoint = _bind_endpoint(_AuthorizedEmptyResourceEndpoint, req)
         self.assertRaises(errors.ClientErrorForbidden, bound_endpoint.get_response)
 
 
@@ -790,9 +765,13 @@ class FilterCachingUnhashableTestCase(django.test.TestCase):
 class ResourceUpdateEndpointDefinitionTestCase(
     testutils.RequestCreatorMixin, django.test.TestCase
 ):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.obj = tests.models.TestModel.objects.create(int_field=24)
+
     def test_mutate_resource(self):
-        obj = tests.models.TestModel(int_field=24)
-        obj.save()
+        obj = self.obj
 
         class _TestEndpoint(machinery.ResourceUpdateEndpointDefinition):
             resource_model = tests.models.TestModel
@@ -986,12 +965,15 @@ class DeferrableTaskTestCase(django.test.TestCase):
         super().__init__(*args, **kwargs)
         if use_generic_endpoint:
             self.test_endpoint = _TestEndpointGenericResource
-            self.patch_target = "django_declarative_apis.machinery.tasks.generic_future_task_runner.apply_async"
+            self.task_runner = generic_future_task_runner
         else:
             self.test_endpoint = _TestEndpoint
-            self.patch_target = (
-                "django_declarative_apis.machinery.tasks.future_task_runner.apply_async"
-            )
+            self.task_runner = future_task_runner
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        _enter_eager_task_runner(cls)
 
     def setUp(self):
         self.test_endpoint.semaphore = {
@@ -1000,6 +982,14 @@ class DeferrableTaskTestCase(django.test.TestCase):
             "filtered_retry_count_1": 0,
             "filtered_retry_count_2": 0,
         }
+        cache.set(tasks.JOB_COUNT_CACHE_KEY, 0)
+        self.addCleanup(cache.delete, tasks.JOB_COUNT_CACHE_KEY)
+
+    def _make_bound_manager(self, expected_response):
+        endpoint = self.test_endpoint(expected_response)
+        manager = _make_manager(endpoint)
+        machinery.EndpointBinder(endpoint).create_bound_endpoint(manager, HttpRequest())
+        return manager
 
     def test_future_task_runner_sets_cid(self):
         data = {"cid": None}
@@ -1007,66 +997,33 @@ class DeferrableTaskTestCase(django.test.TestCase):
         def set_correlation_id(cid):
             data["cid"] = cid
 
-        conf = tasks.future_task_runner.app.conf
-        old_val = conf["task_always_eager"]
-        conf["task_always_eager"] = True
-
         old_set_cid = tasks._set_correlation_id
         old_get_cid = tasks._get_correlation_id
         tasks._set_correlation_id = set_correlation_id
         tasks._get_correlation_id = lambda: "cid-sentinel"
         try:
-            expected_response = {"foo": "bar"}
-            endpoint = self.test_endpoint(expected_response)
-            manager = machinery.EndpointBinder.BoundEndpointManager(
-                machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-            )
-            machinery.EndpointBinder(endpoint).create_bound_endpoint(
-                manager, HttpRequest()
-            )
-
+            manager = self._make_bound_manager({"foo": "bar"})
             manager.get_response()
         finally:
             tasks._set_correlation_id = old_set_cid
             tasks._get_correlation_id = old_get_cid
-            conf["task_always_eager"] = old_val
 
         self.assertEqual("cid-sentinel", data["cid"])
 
     def test_get_response_kombu_error_retried(self):
         expected_response = {"foo": "bar"}
-        endpoint = self.test_endpoint(expected_response)
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
-        machinery.EndpointBinder(endpoint).create_bound_endpoint(manager, HttpRequest())
-
-        conf = tasks.future_task_runner.app.conf
-        old_val = conf["task_always_eager"]
-        conf["task_always_eager"] = True
-
-        cache.set(tasks.JOB_COUNT_CACHE_KEY, 0)
-
-        with mock.patch(self.patch_target) as mock_apply:
-            exceptions = iter(
-                [kombu.exceptions.OperationalError, kombu.exceptions.OperationalError]
-            )
-
-            def _side_effect(*args, **kwargs):
-                try:
-                    raise next(exceptions)
-                except StopIteration:
-                    if self.test_endpoint is _TestEndpointGenericResource:
-                        return generic_future_task_runner.apply(*args, **kwargs)
-                    else:
-                        return future_task_runner.apply(*args, **kwargs)
-
-            mock_apply.side_effect = _side_effect
-
-            try:
-                resp = manager.get_response()
-            finally:
-                conf["task_always_eager"] = old_val
+        manager = self._make_bound_manager(expected_response)
+
+        # fail twice, then let every later call fall through to the eager apply
+        with mock.patch.object(
+            self.task_runner,
+            "apply_async",
+            side_effect=itertools.chain(
+                [kombu.exceptions.OperationalError] * 2, itertools.repeat(mock.DEFAULT)
+            ),
+            wraps=self.task_runner.apply,
+        ):
+            resp = manager.get_response()
 
         self.assertEqual(resp, (http.HTTPStatus.OK, expected_response))
         self.assertTrue(cache.get(tasks.JOB_COUNT_CACHE_KEY) != 0)
@@ -1075,60 +1032,36 @@ class DeferrableTaskTestCase(django.test.TestCase):
             "deferred task executed", self.test_endpoint.semaphore["status"]
         )
 
+    @override_settings(DECLARATIVE_ENDPOINT_TASKS_SYNCHRONOUS_FALLBACK=True)
     def test_async_task_falls_back_to_synchronous_when_configured(self):
         expected_response = {"foo": "bar"}
 
-        endpoint = self.test_endpoint(expected_response)
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
-        machinery.EndpointBinder(endpoint).create_bound_endpoint(manager, HttpRequest())
+        manager = self._make_bound_manager(expected_response)
 
-        conf = tasks.future_task_runner.app.conf
-        old_val = conf["task_always_eager"]
-        conf["task_always_eager"] = True
-
-        with mock.patch(self.patch_target) as mock_apply_async:
+        with mock.patch.object(self.task_runner, "apply_async") as mock_apply_async:
             mock_apply_async.side_effect = kombu.exceptions.OperationalError
 
-            cache.set(tasks.JOB_COUNT_CACHE_KEY, 0)
-
-            with self.settings(DECLARATIVE_ENDPOINT_TASKS_SYNCHRONOUS_FALLBACK=True):
-                try:
-                    manager.get_response()
-                except kombu.exceptions.OperationalError:
-                    self.fail("OperationalError should not have been triggered")
-                finally:
-                    conf["task_always_eager"] = old_val
+            try:
+                manager.get_response()
+            except kombu.exceptions.OperationalError:
+                self.fail("OperationalError should not have been triggered")
 
         self.assertEqual(
             "deferred task executed", self.test_endpoint.semaphore["status"]
         )
 
+    @override_settings(DECLARATIVE_ENDPOINT_TASKS_FORCE_SYNCHRONOUS=True)
     def test_force_synchronous_tasks(self):
         expected_response = {"foo": "bar"}
-        endpoint = self.test_endpoint(expected_response)
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
-        machinery.EndpointBinder(endpoint).create_bound_endpoint(manager, HttpRequest())
-
-        conf = tasks.future_task_runner.app.conf
-        old_val = conf["task_always_eager"]
-        conf["task_always_eager"] = True
+        manager = self._make_bound_manager(expected_response)
 
-        cache.set(tasks.JOB_COUNT_CACHE_KEY, 0)
-
-        with mock.patch(self.patch_target) as mock_apply:
+        with mock.patch.object(self.task_runner, "apply_async") as mock_apply:
             mock_apply.side_effect = kombu.exceptions.OperationalError
 
-            with self.settings(DECLARATIVE_ENDPOINT_TASKS_FORCE_SYNCHRONOUS=True):
-                try:
-                    manager.get_response()
-                except kombu.exceptions.OperationalError:
-                    self.fail("OperationalError should not have been triggered")
-                finally:
-                    conf["task_always_eager"] = old_val
+            try:
+                manager.get_response()
+            except kombu.exceptions.OperationalError:
+                self.fail("OperationalError should not have been triggered")
 
         self.assertEqual(0, mock_apply.call_count)
         self.assertEqual(
@@ -1137,65 +1070,28 @@ class DeferrableTaskTestCase(django.test.TestCase):
 
     def test_get_response_kombu_error_attempts_exceeded(self):
         expected_response = {"foo": "bar"}
-        endpoint = self.test_endpoint(expected_response)
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
-        machinery.EndpointBinder(endpoint).create_bound_endpoint(manager, HttpRequest())
-
-        conf = tasks.future_task_runner.app.conf
-        old_val = conf["task_always_eager"]
-        conf["task_always_eager"] = True
-
-        cache.set(tasks.JOB_COUNT_CACHE_KEY, 0)
-
-        with mock.patch(self.patch_target) as mock_apply:
-            exceptions = iter(
-                [
-                    kombu.exceptions.OperationalError,
-                    kombu.exceptions.OperationalError,
-                    kombu.exceptions.OperationalError,
-                ]
-            )
-
-            def _side_effect(*args, **kwargs):
-                try:
-                    raise next(exceptions)
-                except StopIteration:
-                    return future_task_runner.apply(*args, **kwargs)
-
-            mock_apply.side_effect = _side_effect
-
-            try:
+        manager = self._make_bound_manager(expected_response)
+
+        # fail more often than the runner retries; any later call falls through
+        with mock.patch.object(
+            self.task_runner,
+            "apply_async",
+            side_effect=itertools.chain(
+                [kombu.exceptions.OperationalError] * 3, itertools.repeat(mock.DEFAULT)
+            ),
+            wraps=self.task_runner.apply,
+        ):
+            with self.assertRaises(kombu.exceptions.OperationalError):
                 manager.get_response()
-                self.fail("should have triggered a kombu.exceptions.OperationalError")
-            except kombu.exceptions.OperationalError:
-                pass
-            finally:
-                conf["task_always_eager"] = old_val
 
         self.assertIsNone(self.test_endpoint.semaphore["status"])
 
     def test_get_response_success(self):
         expected_response = {"foo": "bar"}
 
-        endpoint = self.test_endpoint(expected_response)
-        manager = machinery.EndpointBinder.BoundEndpointManager(
-            machinery._EndpointRequestLifecycleManager(endpoint), endpoint
-        )
-        machinery.EndpointBinder(endpoint).create_bound_endpoint(manager, HttpRequest())
-
-        # can't use mock.patch.dict here because it doesn't implement the api that the unpatcher expects
-        conf = tasks.future_task_runner.app.conf
-        old_val = conf["task_always_eager"]
-        conf["task_always_eager"] = True
-
-        cache.set(tasks.JOB_COUNT_CACHE_KEY, 0)
+        manager = self._make_bound_manager(expected_response)
 
-        try:
-            resp = manager.get_response()
-        finally:
-            conf["task_always_eager"] = old_val
+        resp = manager.get_response()
 
         self.assertEqual(resp, (http.HTTPStatus.OK, expected_response))
         self.assertTrue(cache.get(tasks.JOB_COUNT_CACHE_KEY) != 0)
@@ -1207,13 +1103,6 @@ class DeferrableTaskTestCase(django.test.TestCase):
         self.assertEqual(3, self.test_endpoint.semaphore["filtered_retry_count_1"])
         self.assertEqual(1, self.test_endpoint.semaphore["filtered_retry_count_2"])
 
-        self.test_endpoint.semaphore = {
-            "status": None,
-            "retry_count": 0,
-            "filtered_retry_count_1": 0,
-            "filtered_retry_count_2": 0,
-        }
-
     def test_deferrable_methods_must_be_static(self):
         try:
             machinery.deferrable_task()(
@@ -1232,21 +1121,24 @@ class GenericDeferrableTaskTestCase(DeferrableTaskTestCase):
 
 
 class ResourceAsyncJobTestCase(django.test.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        _enter_eager_task_runner(cls)
+
     def test_resource_async_job(self):
         resource = tests.models.TestModel()
         resource.int_field = 1
         resource.save()
 
-        conf = tasks.future_task_runner.app.conf
-        old_val = conf["task_always_eager"]
-        conf["task_always_eager"] = True
-
         tasks.schedule_resource_task_runner(resource.mutate_action)
 
-        conf["task_always_eager"] = old_val
-
-        resource.refresh_from_db()
-        self.assertEqual(2, resource.int_field)
+        self.assertEqual(
+            2,
+            tests.models.TestModel.objects.values_list("int_field", flat=True).get(
+                pk=resource.pk
+            ),
+        )
 
 
 def _bind_endpoint(endpoint_cls, request, url_field=None):
@@ -1257,3 +1149,29 @@ def _bind_endpoint(endpoint_cls, request, url_field=None):
         request,
         url_field=url_field,
     )
+
+
+def _make_manager(endpoint):
+    return machinery.EndpointBinder.BoundEndpointManager(
+        machinery._EndpointRequestLifecycleManager(endpoint), endpoint
+    )
+
+
+@contextlib.contextmanager
+def _eager_task_runner():
+    # can't use mock.patch.dict here because it doesn't implement the api that the unpatcher expects
+    conf = tasks.future_task_runner.app.conf
+    old_val = conf["task_always_eager"]
+    conf["task_always_eager"] = True
+    try:
+        yield
+    finally:
+        conf["task_always_eager"] = old_val
+
+
+def _enter_eager_task_runner(test_case_cls):
+    # runs the test case's tasks eagerly until its class cleanups run
+    # (TestCase.enterClassContext is only available from python 3.11)
+    eager_task_runner = _eager_task_runner()
+    eager_task_runner.__enter__()
+    test_case_cls.addClassCleanup(eager_task_runner.__exit__, None, None, None)
@@ -3,8 +3,17 @@ from django import http
 
 from django_declarative_apis.machinery import errors
 
+_ADDITIONAL_INFO_ERROR_CLASSES = (
+    errors.ClientErrorUnprocessableEntity,
+    errors.ClientErrorNotFound,
+    errors.ClientErrorForbidden,
+    errors.ClientErrorUnauthorized,
+    errors.ClientErrorExternalServiceFailure,
+    errors.ClientErrorTimedOut,
+)
 
-class ErrorTestCase(django.test.TestCase):
+
+class ErrorTestCase(django.test.SimpleTestCase):
     def test_apierror_tuple(self):
         test_code, test_message = test_tuple = errors.HTTPS_REQUIRED
         err = errors.ApiError(error_tuple=test_tuple)
@@ -62,16 +71,8 @@ class ErrorTestCase(django.test.TestCase):
             err.error_code
 
     def test_additional_info_in_error(self):
-        test_classes = [
-            errors.ClientErrorUnprocessableEntity,
-            errors.ClientErrorNotFound,
-            errors.ClientErrorForbidden,
-            errors.ClientErrorUnauthorized,
-            errors.ClientErrorExternalServiceFailure,
-            errors.ClientErrorTimedOut,
-        ]
         test_message = "Test additional info."
-        for cls in test_classes:
+        for cls in _ADDITIONAL_INFO_ERROR_CLASSES:
             with self.subTest(cls):
                 err = cls(additional_info=test_message)
                 self.assertIn(test_message, err.error_message)
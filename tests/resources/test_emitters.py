@@ -8,7 +8,7 @@
 import json
 import pickle
 import unittest
-from xml.dom import minidom
+from xml.etree import ElementTree
 
 import django.http
 import django.test
@@ -17,6 +17,8 @@ import yaml
 import tests.models
 from django_declarative_apis.resources import emitters
 
+_REQUEST = django.test.RequestFactory().get("/")
+
 
 class EmitterTestCase(unittest.TestCase):
     def test_init_data_exception_error(self):
@@ -71,9 +73,7 @@ class EmitterTestCase(unittest.TestCase):
                 return val
 
         em = _StreamEmitter(None, None)
-        for idx, val in enumerate(
-            em.stream_render(django.test.RequestFactory().get("/"))
-        ):
+        for idx, val in enumerate(em.stream_render(_REQUEST)):
             self.assertEqual(val, data[idx])
 
     def test_register_unregister_emitters(self):
@@ -91,26 +91,30 @@ class EmitterTestCase(unittest.TestCase):
 class XMLEmitterTestCase(unittest.TestCase):
     def test_render_success(self):
         em = emitters.XMLEmitter({"foo": "bar"}, lambda: None)
-        resp = em.render(django.test.RequestFactory().get("/"))
-        dom = minidom.parseString(resp)
-        self.assertEqual(dom.getElementsByTagName("foo")[0].childNodes[0].data, "bar")
+        resp = em.render(_REQUEST)
+        root = ElementTree.fromstring(resp)
+        self.assertEqual(root.find("foo").text, "bar")
 
     def test_render_list(self):
         em = emitters.XMLEmitter(["foo", "bar"], lambda: None)
-        resp = em.render(django.test.RequestFactory().get("/"))
-        dom = minidom.parseString(resp)
-        self.assertEqual(len(dom.getElementsByTagName("resource")), 2)
+        resp = em.render(_REQUEST)
+        root = ElementTree.fromstring(resp)
+        self.assertEqual(len(root.findall("resource")), 2)
 
 
 class JSONEmitterTestCase(unittest.TestCase):
     def test_decode(self):
         # one bytes object and one string to test internal decoding
         em = emitters.JSONEmitter([b"foo", "bar"], lambda: None)
-        resp = em.render(django.test.RequestFactory().get("/"))
+        resp = em.render(_REQUEST)
         self.assertEqual(json.loads(resp), ["foo", "bar"])
 
 
-class DjangoEmitterTestCase(unittest.TestCase):
+class DjangoEmitterTestCase(django.test.TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.obj = tests.models.TestModel.objects.create(int_field=42)
+
     def test_render_http_response_succes(self):
         class _Handler:
             def __call__(self):
@@ -129,22 +133,23 @@ class DjangoEmitterTestCase(unittest.TestCase):
         em = emitters.DjangoEmitter(data, lambda: None)
         self.assertEqual(em.render(None), data)
 
-    def test_render_serializable_success(self):
-        tests.models.TestModel.objects.all().delete()
-        tests.models.TestModel()
-
-        em = emitters.DjangoEmitter(tests.models.TestModel.objects.all(), lambda: None)
+    def test_render_serializable_empty(self):
+        em = emitters.DjangoEmitter(tests.models.TestModel.objects.none(), lambda: None)
         resp = em.render(None, format="json")
         self.assertEqual(json.loads(resp), [])
 
-        obj = tests.models.TestModel(int_field=42)
-        obj.save()
-
+    def test_render_serializable_success(self):
         em = emitters.DjangoEmitter(tests.models.TestModel.objects.all(), lambda: None)
         resp = em.render(None, format="json")
         self.assertEqual(
             json.loads(resp),
-            [{"model": "tests.testmodel", "pk": obj.pk, "fields": {"int_field": 42}}],
+            [
+                {
+                    "model": "tests.testmodel",
+                    "pk": self.obj.pk,
+                    "fields": {"int_field": 42},
+                }
+            ],
         )
 
 
@@ -8,7 +8,6 @@
 import http
 import json
 
-import django.conf
 import django.core.exceptions
 import django.test
 from django.test.utils import override_settings
@@ -18,6 +17,22 @@ from django_declarative_apis.authentication.oauthlib import oauth_errors
 from django_declarative_apis.resources import resource
 from tests import testutils
 
+_REQUEST_FACTORY = django.test.RequestFactory()
+
+
+def _handle_ok(request, *args, **kwargs):
+    return http.HTTPStatus.OK, ""
+
+
+class _PostHandler:
+    allowed_methods = ("POST",)
+    method_handlers = {"POST": _handle_ok}
+
+
+class _PutHandler:
+    allowed_methods = ("PUT",)
+    method_handlers = {"PUT": _handle_ok}
+
 
 class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
     def test_call_post(self):
@@ -36,16 +51,10 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
         self.assertEqual(json.loads(resp.content), body)
 
     def test_call_invalid_mime_type(self):
-        class Handler:
-            allowed_methods = ("POST",)
-            method_handlers = {
-                "POST": lambda req, *args, **kwargs: (http.HTTPStatus.OK, "")
-            }
-
         body = {"foo": "bar"}
         req = self.create_request(method="POST", body=body)
 
-        res = resource.Resource(lambda: Handler())
+        res = resource.Resource(_PostHandler)
         with mock.patch(
             "django_declarative_apis.resources.resource.translate_mime"
         ) as mock_translate:
@@ -55,12 +64,6 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
             self.assertEqual(resource_instance.content, b"Bad Request")
 
     def test_call_alternate_charset(self):
-        class Handler:
-            allowed_methods = ("POST",)
-            method_handlers = {
-                "POST": lambda req, *args, **kwargs: (http.HTTPStatus.OK, "")
-            }
-
         body = {"foo": "bar"}
         req = self.create_request(
             method="POST",
@@ -69,17 +72,11 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
             use_auth_header_signature=True,
         )
 
-        res = resource.Resource(lambda: Handler())
+        res = resource.Resource(_PostHandler)
         resource_instance = res(req)
         self.assertEqual(200, resource_instance.status_code)
 
     def test_call_invalid_charset(self):
-        class Handler:
-            allowed_methods = ("POST",)
-            method_handlers = {
-                "POST": lambda req, *args, **kwargs: (http.HTTPStatus.OK, "")
-            }
-
         body = {"foo": "bar"}
         req = self.create_request(
             method="POST",
@@ -88,7 +85,7 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
             use_auth_header_signature=True,
         )
         req.encoding = "utf-8"
-        res = resource.Resource(lambda: Handler())
+        res = resource.Resource(_PostHandler)
         with override_settings(DDA_LOG_MIMER_DATA_EXCEPTION=True):
             with self.assertLogs("django_declarative_apis.resources.utils") as logs:
                 resource_instance = res(req)
@@ -98,15 +95,9 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
         self.assertEqual(400, resource_instance.status_code)
 
     def test_call_put(self):
-        class Handler:
-            allowed_methods = ("PUT",)
-            method_handlers = {
-                "PUT": lambda req, *args, **kwargs: (http.HTTPStatus.OK, "")
-            }
-
         body = {"foo": "bar"}
         req = self.create_request(method="PUT", body=body)
-        res = resource.Resource(lambda: Handler())
+        res = resource.Resource(_PutHandler)
         res(req)
 
         # make sure request coercion did its thing to allow django to support it
@@ -134,9 +125,7 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
 
         handler = Handler()
         res = resource.Resource(lambda: handler)
-        _, anonymous, err = res.authenticate(
-            django.test.RequestFactory().get("/"), "GET"
-        )
+        _, anonymous, err = res.authenticate(_REQUEST_FACTORY.get("/"), "GET")
         self.assertEqual(anonymous, resource.CHALLENGE)
         self.assertIsInstance(err, oauth_errors.OAuthMissingParameterError)
 
@@ -150,7 +139,7 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
 
     def test_init_unset_authentication_handlers(self):
         current_handlers = (
-            django.conf.settings.DECLARATIVE_ENDPOINT_AUTHENTICATION_HANDLERS
+            resource.settings.DECLARATIVE_ENDPOINT_AUTHENTICATION_HANDLERS
         )
         try:
             del resource.settings.DECLARATIVE_ENDPOINT_AUTHENTICATION_HANDLERS
@@ -176,7 +165,7 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
             pass
 
         res = resource.Resource(lambda: Handler())
-        req = django.test.RequestFactory().get("/")
+        req = _REQUEST_FACTORY.get("/")
         try:
             raise Exception("something bad happened")
         except Exception as err:
@@ -191,14 +180,14 @@ class ResourceTestCase(testutils.RequestCreatorMixin, django.test.TestCase):
         self.assertEqual(reporter.exc_type, Exception)
 
     def test_use_emitter(self):
-        resp = django.http.HttpResponse(content_type="image")
-        self.assertFalse(resource.Resource._use_emitter(resp))
-
-        resp = django.http.HttpResponse(content_type="application/json")
-        self.assertFalse(resource.Resource._use_emitter(resp))
-
-        resp = django.http.HttpResponse(content_type="unhandled")
-        self.assertTrue(resource.Resource._use_emitter(resp))
+        for content_type, use_emitter in (
+            ("image", False),
+            ("application/json", False),
+            ("unhandled", True),
+        ):
+            with self.subTest(content_type=content_type):
+                resp = django.http.HttpResponse(content_type=content_type)
+                self.assertEqual(use_emitter, resource.Resource._use_emitter(resp))
 
     def test_email_exception(self):
         with mock.patch(
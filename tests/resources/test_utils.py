@@ -5,6 +5,7 @@
 # For full license text, see the LICENSE file in the repo root or https://opensource.org/licenses/BSD-3-Clause
 #
 
+import functools
 import http
 import json
 import unittest
@@ -17,6 +18,8 @@ from cryptography.hazmat.primitives.asymmetric import rsa
 
 from django_declarative_apis.resources import utils
 
+_REQUEST_FACTORY = django.test.RequestFactory()
+
 
 class UtilsTestCase(unittest.TestCase):
     def test_format_error(self):
@@ -48,7 +51,7 @@ class UtilsTestCase(unittest.TestCase):
         self.assertEqual(
             test_json(
                 self,
-                django.test.RequestFactory().post(
+                _REQUEST_FACTORY.post(
                     "/", {"foo": "bar"}, content_type="application/json"
                 ),
             ),
@@ -58,7 +61,7 @@ class UtilsTestCase(unittest.TestCase):
         self.assertEqual(
             test_json(
                 self,
-                django.test.RequestFactory().post("/", "", content_type="text/plain"),
+                _REQUEST_FACTORY.post("/", "", content_type="text/plain"),
             ).status_code,
             http.HTTPStatus.BAD_REQUEST,
         )
@@ -66,14 +69,14 @@ class UtilsTestCase(unittest.TestCase):
 
 class MimerTestCase(unittest.TestCase):
     def test_is_multipart(self):
-        req = django.test.RequestFactory().get("/", content_type="text/plain")
+        req = _REQUEST_FACTORY.get("/", content_type="text/plain")
         self.assertFalse(utils.Mimer(req).is_multipart())
 
-        req = django.test.RequestFactory().post("/", content_type="multipart/form-data")
+        req = _REQUEST_FACTORY.post("/", content_type="multipart/form-data")
         self.assertTrue(utils.Mimer(req).is_multipart())
 
     def test_loader_for_type(self):
-        req = django.test.RequestFactory().post(
+        req = _REQUEST_FACTORY.post(
             "/", json.dumps({"foo": "bar"}), content_type="application/json"
         )
         mimer = utils.Mimer(req)
@@ -81,7 +84,7 @@ class MimerTestCase(unittest.TestCase):
 
     def test_translate(self):
         data = {"foo": "bar"}
-        req = django.test.RequestFactory().post(
+        req = _REQUEST_FACTORY.post(
             "/", json.dumps(data), content_type="application/json"
         )
         mimer = utils.Mimer(req)
@@ -96,16 +99,14 @@ class MimerTestCase(unittest.TestCase):
             {None: "application_json"},
             clear=True,
         ):
-            req = django.test.RequestFactory().post(
+            req = _REQUEST_FACTORY.post(
                 "/", {"foo": "bar"}, content_type="application/json"
             )
             mimer = utils.Mimer(req)
             self.assertIsNone(mimer.translate().data)
 
     def test_translate_invalid_data(self):
-        req = django.test.RequestFactory().post(
-            "/", "notjson", content_type="application/json"
-        )
+        req = _REQUEST_FACTORY.post("/", "notjson", content_type="application/json")
         mimer = utils.Mimer(req)
         self.assertRaises(utils.MimerDataException, mimer.translate)
 
@@ -113,7 +114,7 @@ class MimerTestCase(unittest.TestCase):
         deserializer, content_type = lambda _: None, "foo"
         utils.Mimer.register(deserializer, content_type)
 
-        req = django.test.RequestFactory().post("/", "", content_type=content_type)
+        req = _REQUEST_FACTORY.post("/", "", content_type=content_type)
         mimer = utils.Mimer(req)
         self.assertEqual(mimer.loader_for_type(content_type), deserializer)
 
@@ -146,6 +147,11 @@ class KeyProcessingTestCase(unittest.TestCase):
         ),
     }
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.public_key_pem = _standard_public_key_pem()
+
     def test_nonstandard_public_key(self):
         for key_name in ["IOS_PUBLIC", "ANDROID_PUBLIC"]:
             with self.subTest(key_name=key_name):
@@ -154,13 +160,20 @@ class KeyProcessingTestCase(unittest.TestCase):
                 self.assertTrue(processed.endswith("-----END PUBLIC KEY-----"))
 
     def test_standard_public_key(self):
-        # example from `cryptography` documentation
-        private_key = rsa.generate_private_key(
-            public_exponent=65537, key_size=2048, backend=default_backend()
+        self.assertEqual(
+            self.public_key_pem, utils.preprocess_rsa_key(self.public_key_pem)
         )
-        public_key = private_key.public_key()
-        public_key_str = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        ).decode("utf8")
-        self.assertEqual(public_key_str, utils.preprocess_rsa_key(public_key_str))
+
+
+@functools.lru_cache(maxsize=None)
+def _standard_public_key_pem():
+    # example from `cryptography` documentation; key generation is slow, so only
+    # do it once per process
+    private_key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048, backend=default_backend()
+    )
+    public_key = private_key.public_key()
+    return public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode("utf8")
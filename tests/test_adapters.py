@@ -12,6 +12,8 @@ import django.test
 
 from django_declarative_apis import adapters, authentication, machinery
 
+_REQUEST_FACTORY = django.test.RequestFactory()
+
 
 class BaseHandlerTestCase(unittest.TestCase):
     def test_supported_methods(self):
@@ -75,7 +77,7 @@ class EndpointHandlerTestCase(unittest.TestCase):
         self.assertIn(expected_field, docs["GET"][0]["fields"])
 
     def test_handle_request(self):
-        req = django.test.RequestFactory().get("/simple")
+        req = _REQUEST_FACTORY.get("/simple")
         req.consumer = None
         resp = adapters.EndpointHandler(get=_HandlerA).handle_request("GET", req)
         self.assertEqual(resp, (http.HTTPStatus.OK, _HandlerA.RESPONSE))
@@ -106,7 +108,7 @@ class EndpointHandlerTestCase(unittest.TestCase):
                 pass
 
         authenticator = _Authenticator()
-        req = django.test.RequestFactory().get("/simple")
+        req = _REQUEST_FACTORY.get("/simple")
         req.consumer = None
         resource = adapters.EndpointResource(
             get=_HandlerWithoutCustomField, authentication={None: [authenticator]}
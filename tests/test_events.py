@@ -23,6 +23,18 @@ class EmitEventsTest(unittest.TestCase):
         self.assertTrue(callable(hook_function))
         self.assertEqual(hook_function.__name__, "test_function")
 
+    def test_import_hook_loaded_module(self):
+        hook_path = "tests.test_events.test_function"
+        with patch("django_declarative_apis.events.importlib") as mock_importlib:
+            self.assertIs(_import_hook(hook_path), test_function)
+        mock_importlib.import_module.assert_not_called()
+
+    def test_import_hook_patched(self):
+        hook_path = "tests.test_events.test_function"
+        _import_hook(hook_path)
+        with patch("tests.test_events.test_function") as mock_hook_function:
+            self.assertIs(_import_hook(hook_path), mock_hook_function)
+
     def test_invalid_hook_path(self):
         with self.assertRaises(ValueError) as context:
             _import_hook("invalid_path")
@@ -15,21 +15,22 @@ from . import models
 
 
 class FiltersTestCase(django.test.TestCase):
-    def setUp(self):
-        self.test_model = models.TestModel.objects.create(id=1, int_field=1)
-        self.p1 = models.ParentModel.objects.create(nonstandard_id=2, name="p1")
-        self.p1c1 = models.ChildModel.objects.create(
-            id=3, test=self.test_model, name="p1c1", parent=self.p1
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_model = models.TestModel.objects.create(id=1, int_field=1)
+        cls.p1 = models.ParentModel.objects.create(nonstandard_id=2, name="p1")
+        cls.p1c1 = models.ChildModel.objects.create(
+            id=3, test=cls.test_model, name="p1c1", parent=cls.p1
         )
-        self.p1c2 = models.ChildModel.objects.create(
-            id=4, test=self.test_model, name="p1c2", parent=self.p1
+        cls.p1c2 = models.ChildModel.objects.create(
+            id=4, test=cls.test_model, name="p1c2", parent=cls.p1
         )
-        self.p1.favorite = self.p1c1
-        self.p1.save()
+        cls.p1.favorite = cls.p1c1
+        cls.p1.save()
 
-        self.root = models.RootNode.objects.create(id=5, parent_field=self.p1)
-        self.p1.root = self.root
-        self.p1.save()
+        cls.root = models.RootNode.objects.create(id=5, parent_field=cls.p1)
+        cls.p1.root = cls.root
+        cls.p1.save()
 
     def test_expandable_generic_field(self):
         # test unexpanded
@@ -51,7 +52,7 @@ class FiltersTestCase(django.test.TestCase):
     def test_expandable_field_not_expanded_by_default(self):
         filtered = filtering.apply_filters_to_object(self.root, filters.DEFAULT_FILTERS)
         self.assertEqual(4, len(filtered))
-        self.assertTrue("parent_field" in filtered)
+        self.assertIn("parent_field", filtered)
         self.assertEqual(1, len(filtered["parent_field"]))
         self.assertEqual(
             self.p1.nonstandard_id, filtered["parent_field"]["nonstandard_id"]
@@ -62,7 +63,7 @@ class FiltersTestCase(django.test.TestCase):
             self.root, filters.DEFAULT_FILTERS, expand_header="parent_field"
         )
         self.assertEqual(4, len(filtered))
-        self.assertTrue("parent_field" in filtered)
+        self.assertIn("parent_field", filtered)
         self.assertEqual(5, len(filtered["parent_field"]))
         self.assertEqual(
             self.p1.nonstandard_id, filtered["parent_field"]["nonstandard_id"]
@@ -72,14 +73,14 @@ class FiltersTestCase(django.test.TestCase):
         self.assertEqual(2, len(filtered["parent_field"]["children"]))
         for child in filtered["parent_field"]["children"]:
             self.assertEqual(1, len(child))
-            self.assertTrue("name" in child)
+            self.assertIn("name", child)
 
     def test_expand_multi_level(self):
         filtered = filtering.apply_filters_to_object(
             self.root, filters.DEFAULT_FILTERS, expand_header="parent_field.favorite"
         )
         self.assertEqual(4, len(filtered))
-        self.assertTrue("parent_field" in filtered)
+        self.assertIn("parent_field", filtered)
         self.assertEqual(5, len(filtered["parent_field"]))
         self.assertEqual(
             self.p1.nonstandard_id, filtered["parent_field"]["nonstandard_id"]
@@ -90,29 +91,29 @@ class FiltersTestCase(django.test.TestCase):
         self.assertEqual(2, len(filtered["parent_field"]["children"]))
         for child in filtered["parent_field"]["children"]:
             self.assertEqual(1, len(child))
-            self.assertTrue("name" in child)
+            self.assertIn("name", child)
 
     def test_expand_multi_level_reverse_fk_relation(self):
         filtered = filtering.apply_filters_to_object(
             self.root, filters.DEFAULT_FILTERS, expand_header="parent_field.children"
         )
         self.assertEqual(4, len(filtered))
-        self.assertTrue("parent_field" in filtered)
+        self.assertIn("parent_field", filtered)
         self.assertEqual(5, len(filtered["parent_field"]))
         self.assertEqual(
             self.p1.nonstandard_id, filtered["parent_field"]["nonstandard_id"]
         )
         self.assertEqual(self.p1.name, filtered["parent_field"]["name"])
         self.assertEqual(1, len(filtered["parent_field"]["favorite"]))
-        self.assertTrue("name" in filtered["parent_field"]["favorite"])
+        self.assertIn("name", filtered["parent_field"]["favorite"])
         self.assertEqual(self.p1c1.name, filtered["parent_field"]["favorite"]["name"])
         self.assertEqual(2, len(filtered["parent_field"]["children"]))
         for child in filtered["parent_field"]["children"]:
             self.assertEqual(5, len(child))
-            self.assertTrue("pk" in child)
-            self.assertTrue("name" in child)
-            self.assertTrue("test" in child)
-            self.assertTrue("parent" in child)
+            self.assertIn("pk", child)
+            self.assertIn("name", child)
+            self.assertIn("test", child)
+            self.assertIn("parent", child)
             self.assertEqual(1, len(child["parent"]))
 
     def test_expand_multi_level_more_than_one_field(self):
@@ -122,27 +123,27 @@ class FiltersTestCase(django.test.TestCase):
             expand_header="parent_field,parent_field.children, parent_field.favorite.test",
         )
         self.assertEqual(4, len(filtered))
-        self.assertTrue("parent_field" in filtered)
+        self.assertIn("parent_field", filtered)
         self.assertEqual(5, len(filtered["parent_field"]))
         self.assertEqual(
             self.p1.nonstandard_id, filtered["parent_field"]["nonstandard_id"]
         )
         self.assertEqual(self.p1.name, filtered["parent_field"]["name"])
         self.assertEqual(5, len(filtered["parent_field"]["favorite"]))
-        self.assertTrue("pk" in filtered["parent_field"]["favorite"])
-        self.assertTrue("name" in filtered["parent_field"]["favorite"])
-        self.assertTrue("test" in filtered["parent_field"]["favorite"])
+        self.assertIn("pk", filtered["parent_field"]["favorite"])
+        self.assertIn("name", filtered["parent_field"]["favorite"])
+        self.assertIn("test", filtered["parent_field"]["favorite"])
         self.assertEqual(4, len(filtered["parent_field"]["favorite"]["test"]))
-        self.assertTrue("parent" in filtered["parent_field"]["favorite"])
+        self.assertIn("parent", filtered["parent_field"]["favorite"])
         self.assertEqual(self.p1c1.name, filtered["parent_field"]["favorite"]["name"])
         self.assertEqual(2, len(filtered["parent_field"]["children"]))
         for child in filtered["parent_field"]["children"]:
             self.assertEqual(5, len(child))
-            self.assertTrue("pk" in child)
-            self.assertTrue("name" in child)
-            self.assertTrue("test" in child)
+            self.assertIn("pk", child)
+            self.assertIn("name", child)
+            self.assertIn("test", child)
             self.assertEqual(1, len(child["test"]))
-            self.assertTrue("parent" in child)
+            self.assertIn("parent", child)
             self.assertEqual(1, len(child["parent"]))
 
     def test_expandable_properties(self):
@@ -153,36 +154,36 @@ class FiltersTestCase(django.test.TestCase):
         )
 
         self.assertEqual(6, len(filtered))
-        self.assertTrue("expandable_dict" in filtered)
+        self.assertIn("expandable_dict", filtered)
         self.assertEqual(
             filtered["expandable_dict"], models.TestModel.EXPANDABLE_DICT_RETURN
         )
-        self.assertTrue("expandable_string" in filtered)
+        self.assertIn("expandable_string", filtered)
         self.assertEqual(
             filtered["expandable_string"], models.TestModel.EXPANDABLE_STRING_RETURN
         )
-        self.assertTrue("__expandable__" in filtered)
-        self.assertTrue("expandable_dict" in filtered["__expandable__"])
-        self.assertTrue("expandable_string" in filtered["__expandable__"])
+        self.assertIn("__expandable__", filtered)
+        self.assertIn("expandable_dict", filtered["__expandable__"])
+        self.assertIn("expandable_string", filtered["__expandable__"])
 
-        with mock.patch(
-            "tests.models.TestModel.expandable_dict"
-        ) as dict_mock, mock.patch(
-            "tests.models.TestModel.expandable_string"
+        with mock.patch.object(
+            models.TestModel, "expandable_dict"
+        ) as dict_mock, mock.patch.object(
+            models.TestModel, "expandable_string"
         ) as str_mock:
             filtered = filtering.apply_filters_to_object(
                 self.test_model, filters.DEFAULT_FILTERS
             )
 
             self.assertEqual(4, len(filtered))
-            self.assertFalse("expandable_dict" in filtered)
+            self.assertNotIn("expandable_dict", filtered)
             dict_mock.assert_not_called()
-            self.assertFalse("expandable_string" in filtered)
+            self.assertNotIn("expandable_string", filtered)
             str_mock.assert_not_called()
-            self.assertTrue("__expandable__" in filtered)
-            self.assertTrue("expandable_dict" in filtered["__expandable__"])
-            self.assertTrue("expandable_string" in filtered["__expandable__"])
-            self.assertTrue("expandable_generic" in filtered["__expandable__"])
+            self.assertIn("__expandable__", filtered)
+            self.assertIn("expandable_dict", filtered["__expandable__"])
+            self.assertIn("expandable_string", filtered["__expandable__"])
+            self.assertIn("expandable_generic", filtered["__expandable__"])
 
     def test_expandable_absent_if_no_expandable_fields(self):
         filtered = filtering.apply_filters_to_object(
@@ -190,11 +191,11 @@ class FiltersTestCase(django.test.TestCase):
         )
 
         self.assertEqual(4, len(filtered))
-        self.assertTrue("expandable_dict" in filtered)
+        self.assertIn("expandable_dict", filtered)
         self.assertEqual(
             filtered["expandable_dict"], models.TestModel.EXPANDABLE_DICT_RETURN
         )
-        self.assertTrue("expandable_string" in filtered)
+        self.assertIn("expandable_string", filtered)
         self.assertEqual(
             filtered["expandable_string"], models.TestModel.EXPANDABLE_STRING_RETURN
         )
@@ -240,3 +241,24 @@ class FiltersTestCase(django.test.TestCase):
         self.assertTrue(4, len(filtered["renamed_test"]))
         self.assertIn("renamed_expandable_dict", filtered["renamed_test"])
         self.assertIn("renamed_expandable_string", filtered["renamed_test"])
+
+    def test_repeated_expand_header_reuses_unmodified_tree(self):
+        expand_header = "parent_field,parent_field.children, parent_field.favorite.test"
+        expected_tree = {
+            "parent_field": {"children": {}, "favorite": {"test": {}}},
+        }
+
+        first = filtering.apply_filters_to_object(
+            self.root, filters.DEFAULT_FILTERS, expand_header=expand_header
+        )
+        second = filtering.apply_filters_to_object(
+            self.root, filters.DEFAULT_FILTERS, expand_header=expand_header
+        )
+        self.assertEqual(first, second)
+
+        tree = filtering._parse_expand_header(expand_header)
+        self.assertIs(filtering._parse_expand_header(expand_header), tree)
+        self.assertEqual(tree, expected_tree)
+        with self.assertRaises(TypeError):
+            tree["parent_field"]["children"]["unexpected"] = {}
+        self.assertEqual(tree, expected_tree)
@@ -5,18 +5,15 @@
 # For full license text, see the LICENSE file in the repo root or https://opensource.org/licenses/BSD-3-Clause
 #
 
+import functools
 import json
 import time
 import urllib.parse
 import logging
 
-import oauth2
-
 from oauthlib import oauth1 as oauthlib_oauth1
 from oauthlib import common as oauthlib_common
 
-from django.http import QueryDict
-
 import django.test
 from django.test import Client
 from django.test.client import ClientHandler
@@ -26,10 +23,16 @@ from django_declarative_apis import models
 
 DEFAULT_CONTENT_TYPE = "application/x-www-form-urlencoded"
 _ENCODERS = {
-    DEFAULT_CONTENT_TYPE: lambda data: urllib.parse.urlencode(data),
-    "application/json": lambda data: json.dumps(data),
-    "application/json; charset=utf-16": lambda data: json.dumps(data),
+    DEFAULT_CONTENT_TYPE: urllib.parse.urlencode,
+    "application/json": json.dumps,
 }
+_REQUEST_FACTORY = django.test.RequestFactory()
+
+
+def _encode_body(content_type, body):
+    # content type parameters (e.g. charset) don't change how the body is serialized
+    media_type = content_type.split(";", 1)[0].strip()
+    return _ENCODERS[media_type](body)
 
 
 class NoLoggingTestRunner(DiscoverRunner):
@@ -42,9 +45,14 @@ class NoLoggingTestRunner(DiscoverRunner):
 
 
 class RequestCreatorMixin:
-    def setUp(self):
-        self.consumer = models.OauthConsumer.objects.create(name="test")
-        self.consumer.save()
+    # set to False in test cases that never authenticate their requests, to skip the
+    # OAuth signing in create_request
+    sign_requests = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.consumer = models.OauthConsumer.objects.create(name="test")
 
     def create_request(
         self,
@@ -55,10 +63,10 @@ class RequestCreatorMixin:
         content_type=DEFAULT_CONTENT_TYPE,
         use_auth_header_signature=False,
     ):
-        meth = getattr(django.test.RequestFactory(), method.lower())
+        meth = getattr(_REQUEST_FACTORY, method.lower())
         req = meth(
             path,
-            _ENCODERS[content_type](body) if body else None,
+            _encode_body(content_type, body) if body else None,
             content_type=content_type,
         )
         req.consumer = self.consumer
@@ -69,14 +77,27 @@ class RequestCreatorMixin:
             params.update(url_fields)
             req.GET = params
 
-        # TODO: this should be better documented or on by default. If this is omitted or False, then requests will
-        # fail in resource input validation (ResourceUpdateEndpointDefinition.validate_input)
-        req.META["use_auth_header_signature"] = use_auth_header_signature
-        OAuthClientHandler._build_request(req)
+        if self.sign_requests:
+            # TODO: this should be better documented or on by default. If this is omitted or False, then requests will
+            # fail in resource input validation (ResourceUpdateEndpointDefinition.validate_input)
+            req.META["use_auth_header_signature"] = use_auth_header_signature
+            OAuthClientHandler._build_request(req)
 
         return req
 
 
+@functools.lru_cache(maxsize=128)
+def _oauth1_client(consumer_key, consumer_secret, signature_method, rsa_key):
+    # clients only hold credentials and signing options, so one can sign any number of
+    # requests
+    return oauthlib_oauth1.Client(
+        consumer_key,
+        client_secret=consumer_secret,
+        signature_method=signature_method,
+        rsa_key=rsa_key,
+    )
+
+
 class OAuthClientHandler(ClientHandler):
     one_time_client_timestamp_override = None
 
@@ -91,7 +112,8 @@ class OAuthClientHandler(ClientHandler):
 
     @classmethod
     def _build_request(cls, request):
-        consumer = request.META.get("consumer")
+        meta = request.META
+        consumer = meta.get("consumer")
 
         # Make request params mutable so we can add authorization parameters.
         # We make the params immutable again before processing the request
@@ -105,13 +127,18 @@ class OAuthClientHandler(ClientHandler):
                 data = request.GET
 
             # This provides a way for us to override default values for testing.
-            oauth_version = request.META.get("oauth_version", "1.0")
-            oauth_nonce = request.META.get("oauth_nonce", oauth2.generate_nonce())
-            oauth_client_timestamp = request.META.get(
-                "oauth_timestamp", cls.get_oauth_client_timestamp()
-            )
+            # Defaults are only computed when no override is given.
+            oauth_version = meta.get("oauth_version", "1.0")
+            if "oauth_nonce" in meta:
+                oauth_nonce = meta["oauth_nonce"]
+            else:
+                oauth_nonce = oauthlib_common.generate_nonce()
+            if "oauth_timestamp" in meta:
+                oauth_client_timestamp = meta["oauth_timestamp"]
+            else:
+                oauth_client_timestamp = cls.get_oauth_client_timestamp()
 
-            rsa_key = request.META.get("rsa_key", None)
+            rsa_key = meta.get("rsa_key", None)
             oauth_signature_method = (
                 oauthlib_oauth1.SIGNATURE_RSA
                 if rsa_key
@@ -126,65 +153,47 @@ class OAuthClientHandler(ClientHandler):
                 "oauth_signature_method": oauth_signature_method,
             }
 
-            # collect ALL request parameters (original + OAuth) for signing
-            all_request_parameters = data.copy()
-            all_request_parameters.update(oauth_signature_data)
-
-            if oauth_signature_method == oauthlib_oauth1.SIGNATURE_RSA:
-                # use RSA-SHA1 signature method
-                oauth1_client = oauthlib_oauth1.Client(
-                    consumer.key,
-                    signature_method=oauth_signature_method,
-                    rsa_key=rsa_key,
-                )
-
-                oauth_request = oauthlib_common.Request(
-                    request.build_absolute_uri(request.path),
-                    http_method=request.method,
-                    body=all_request_parameters,
+            # collect ALL request parameters (original + OAuth) for signing. They're passed
+            # form-encoded because oauthlib collapses a dict or list of pairs body to one
+            # value per key, and every value of a repeated key must be signed
+            request_parameters = [
+                (key, value) for key, values in data.lists() for value in values
+            ]
+            if request.method == "PUT" and request.content_type == DEFAULT_CONTENT_TYPE:
+                # django only parses form bodies of POSTs, but a PUT's form body is signed too
+                request_parameters += urllib.parse.parse_qsl(
+                    request.body.decode(), keep_blank_values=True
                 )
+            all_request_parameters = urllib.parse.urlencode(
+                request_parameters + list(oauth_signature_data.items())
+            )
 
-                oauth_signature_data[
-                    "oauth_signature"
-                ] = oauth1_client.get_oauth_signature(oauth_request)
-            else:
-                # use HMAC-SHA1 signature method
-                oauth_signature_data.update({"oauth_signature_method": "HMAC-SHA1"})
-
-                # Create oauth request object to compute signature
-                oauth_request = oauth2.Request.from_consumer_and_token(
-                    consumer,
-                    None,
-                    request.method,
-                    request.build_absolute_uri(request.path),
-                    all_request_parameters,
-                    is_form_encoded=True,
-                )
+            oauth1_client = _oauth1_client(
+                consumer.key, consumer.secret, oauth_signature_method, rsa_key
+            )
 
-                # Add signature to django request
-                signature_method = oauth2.SignatureMethod_HMAC_SHA1()
-                oauth_request.sign_request(signature_method, consumer, None)
-                oauth_signature_data["oauth_signature"] = oauth_request.get_parameter(
-                    "oauth_signature"
-                ).decode("utf-8")
+            oauth_request = oauthlib_common.Request(
+                request.build_absolute_uri(request.path),
+                http_method=request.method,
+                body=all_request_parameters,
+            )
 
-            use_auth_header_signature = request.META.pop(
-                "use_auth_header_signature", False
+            oauth_signature_data["oauth_signature"] = oauth1_client.get_oauth_signature(
+                oauth_request
             )
+
+            use_auth_header_signature = meta.pop("use_auth_header_signature", False)
             if use_auth_header_signature:
                 auth_header_string = "OAuth " + ",".join(
-                    [
-                        '{0}="{1}"'.format(key, value)
-                        for key, value in oauth_signature_data.items()
-                    ]
+                    f'{key}="{value}"' for key, value in oauth_signature_data.items()
                 )
-                request.META["HTTP_AUTHORIZATION"] = auth_header_string
+                meta["HTTP_AUTHORIZATION"] = auth_header_string
             else:
                 data.update(oauth_signature_data)
 
-        # Recreate the GET and POST QueryDicts to make them immutable, as in production
-        request.POST = QueryDict(request.POST.urlencode().encode("utf-8"))
-        request.GET = QueryDict(request.GET.urlencode().encode("utf-8"))
+        # Make the GET and POST QueryDicts immutable again, as in production
+        request.POST._mutable = False
+        request.GET._mutable = False
 
     def get_response(self, request):
         self._build_request(request)
@@ -210,11 +219,11 @@ class DeclarativeApisOAuthClient(Client):
 
     def put(self, path, data=None, expected_status_code=None, **kwargs):
         if "content_type" not in kwargs:
-            data = data or {}
-            kwargs["content_type"] = "application/x-www-form-urlencoded"
-            data_qd = QueryDict(mutable=True)
-            data_qd.update(data)
-            data = data_qd.urlencode()
+            kwargs["content_type"] = DEFAULT_CONTENT_TYPE
+            # a QueryDict/MultiValueDict would only give urlencode its last value per key
+            if hasattr(data, "lists"):
+                data = list(data.lists())
+            data = urllib.parse.urlencode(data or {}, doseq=True)
 
         return super().put(
             path, data, expected_status_code=expected_status_code, **kwargs
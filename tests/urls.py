@@ -24,4 +24,5 @@ urlpatterns = [
         r"^nestedpydanticfield$",
         resource_adapter(post=views.NestedPydanticFieldEndpointDefinition),
     ),
+    re_path(r"^formdata$", resource_adapter(put=views.FormDataEchoEndpointDefinition)),
 ]
@@ -15,6 +15,7 @@ import pydantic
 
 from django_declarative_apis.machinery import (
     EndpointDefinition,
+    RawRequestObjectProperty,
     field,
     deferrable_task,
     endpoint_resource,
@@ -106,3 +107,14 @@ class NestedPydanticFieldEndpointDefinition(EndpointDefinition):
                 self.nested_pydantic_type_field.json()
             ),
         }
+
+
+class FormDataEchoEndpointDefinition(EndpointDefinition):
+    def is_authorized(self):
+        return True
+
+    request = RawRequestObjectProperty(additional_safe_fields=("data",))
+
+    @endpoint_resource(type=dict)
+    def resource(self):
+        return {"tag": self.request.data.getlist("tag")}